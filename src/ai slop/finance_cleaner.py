@@ -17,10 +17,12 @@ Typical usage (in another notebook / script):
 from __future__ import annotations
 
 import glob
-import hashlib
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -33,11 +35,41 @@ __all__ = [
     "clean_transactions",
 ]
 
+# Progress messages go to DEBUG so library use stays quiet; run the module as a
+# script (or configure logging) to see them.
+logger = logging.getLogger(__name__)
+
 ###############################################################################
 # I/O helpers
 ###############################################################################
 
 
+# Columns read as raw strings; `convert_types` parses them, so there is no point
+# letting the CSV reader infer types for them first.
+_CSV_DTYPES = {"Amount": str, "Is Hidden": str, "Is Pending": str}
+
+
+def _read_one(f: str) -> Optional[pd.DataFrame]:
+    """Read a single CSV with the (multithreaded) pyarrow engine; None on failure."""
+    try:
+        file_name = Path(f).name
+        df = pd.read_csv(f, engine="pyarrow", dtype=_CSV_DTYPES)
+        df["SourceFile"] = file_name
+        logger.debug("✅ Read in frame %s with shape %s", file_name, df.shape)
+        return df
+    except Exception as exc:  # pragma: no cover – we just warn.
+        logger.warning("Skipping %s: %s", f, exc)
+        return None
+
+
+def _match_files(pattern: str) -> List[str]:
+    """Sorted list of files matching *pattern*; warns if there are none."""
+    files = sorted(glob.glob(pattern))
+    if not files:
+        logger.warning("No CSVs matched pattern %r", pattern)
+    return files
+
+
 def read_transactions(pattern: str = "../data/transactions_*.csv") -> pd.DataFrame:
     """Read all CSVs matching *pattern* and add a *SourceFile* column.
 
@@ -51,23 +83,16 @@ def read_transactions(pattern: str = "../data/transactions_*.csv") -> pd.DataFra
     pd.DataFrame
         Concatenated frame of all CSVs; empty if no files exist.
     """
-    print("\n=== READING IN FILES ===\n")
+    logger.debug("=== READING IN FILES ===")
 
-    files: List[str] = sorted(glob.glob(pattern))
+    files = _match_files(pattern)
     if not files:
-        print(f"No CSVs matched pattern {pattern!r}")
         return pd.DataFrame()
 
-    frames: List[pd.DataFrame] = []
-    for f in files:
-        try:
-            file_name = Path(f).name
-            df = pd.read_csv(f)
-            df["SourceFile"] = file_name
-            print(f"✅ Read in frame {file_name} with shape {df.shape}")
-            frames.append(df)
-        except Exception as exc:  # pragma: no cover – we just warn.
-            print(f"[WARN] Skipping {f!s}: {exc}")
+    # Files are independent and the Arrow parser releases the GIL, so read them
+    # concurrently; map() keeps the frames in sorted file order.
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        frames = [df for df in executor.map(_read_one, files) if df is not None]
     return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
 
@@ -76,20 +101,28 @@ def read_transactions(pattern: str = "../data/transactions_*.csv") -> pd.DataFra
 ###############################################################################
 
 
-def _row_hash(row: pd.Series, *, include_source: bool) -> str:
-    """Generate a stable 5-char SHA-256 hash for *row*.
+# Grouping key columns added by `add_row_hashes`; never summed when coalescing.
+_KEY_COLS = ("IntraKey", "CrossKey")
+
+
+def _row_keys(df: pd.DataFrame, *, include_source: bool) -> np.ndarray:
+    """Label every row of *df* with a uint64 hash shared by identical rows.
 
     If *include_source* is False the *SourceFile* column is excluded to capture
     duplicates **within** the same file only ("intra" duplicates).
+
+    The full 64-bit hash of each row depends only on that row's values, so keys
+    computed one file at a time agree across files, provided every file has the
+    same columns in the same order (see `clean_transactions`).
     """
-    vals: Iterable[str]
-    if include_source:
-        vals = row.astype(str).values  # all cols incl. SourceFile
-    else:
-        vals = row.drop(labels=["SourceFile"], errors="ignore").astype(str).values
+    if not include_source:
+        df = df.drop(columns=["SourceFile"], errors="ignore")
 
-    joined: str = "".join(vals)
-    return hashlib.sha256(joined.encode()).hexdigest()[:5]
+    # Columns `convert_types` leaves alone (e.g. Tags) keep whatever dtype the
+    # reader inferred for that file – an all-empty column may come back as float
+    # in one file and text in the next – so hash them as Arrow strings instead.
+    untyped = {c: "string[pyarrow]" for c in df.columns if c not in _TYPED_COLS}
+    return pd.util.hash_pandas_object(df.astype(untyped), index=False).to_numpy()
 
 
 def add_row_hashes(df: pd.DataFrame) -> pd.DataFrame:
@@ -99,33 +132,27 @@ def add_row_hashes(df: pd.DataFrame) -> pd.DataFrame:
     * `CrossKey`  – unique identifier across all files, used to deduplicate within files
     * `IntraKey`  – unique identifier based on content regardless of file, used to deduplicate across files
     * `RowID`     – stable index built from `CrossKey` + duplicate counter
+
+    *df* is modified in place (and returned) to avoid copying the whole frame.
     """
     if df.empty:
-        return df.copy()
-
-    print("\n=== ADDING ROW HASHES ===\n")
-
-    intra, cross = zip(
-        *df.apply(
-            lambda r: (
-                _row_hash(r, include_source=False),
-                _row_hash(r, include_source=True),
-            ),
-            axis=1,
-        )
-    )
-    df = df.copy()
+        return df
+
+    logger.debug("=== ADDING ROW HASHES ===")
+
+    intra = _row_keys(df, include_source=False)
+    cross = _row_keys(df, include_source=True)
     df["IntraKey"] = intra
     df["CrossKey"] = cross
 
     # Create deterministic unique row identifier ➜ CrossKey suffix with counter
-    df["RowID"] = (
-        df.groupby("CrossKey").cumcount().add(1).astype(str).radd(df["CrossKey"] + "_")
+    counters = df.groupby("CrossKey", sort=False).cumcount().add(1).tolist()
+    df.index = pd.Index(
+        [f"{key}_{n}" for key, n in zip(cross.tolist(), counters)], name="RowID"
     )
-    df.set_index("RowID", inplace=True)
 
-    print("✅ Created columns IntraKey, CrossKey, and RowID")
-    print("✅ Set RowID as index")
+    logger.debug("✅ Created columns IntraKey, CrossKey, and RowID")
+    logger.debug("✅ Set RowID as index")
     return df
 
 
@@ -134,45 +161,108 @@ def add_row_hashes(df: pd.DataFrame) -> pd.DataFrame:
 ###############################################################################
 
 
+# Lower-cased flag values; anything in neither set becomes <NA>.
+_TRUTHY_STRINGS = np.array(["yes", "y", "true"], dtype=object)
+_FALSY_STRINGS = np.array(["no", "n", "false"], dtype=object)
+
+
 def _to_bool(s: pd.Series) -> pd.Series:
-    mapping = {
-        "yes": True,
-        "no": False,
-        "y": True,
-        "n": False,
-        True: True,
-        False: False,
-    }
-    return s.str.lower().map(mapping)
+    # Lower-case once in Arrow, then compare whole arrays against the known
+    # spellings instead of looking every cell up in a dict.
+    lowered = s.astype("string[pyarrow]").str.lower().to_numpy(
+        dtype=object, na_value=""
+    )
+    truthy = np.isin(lowered, _TRUTHY_STRINGS)
+    known = truthy | np.isin(lowered, _FALSY_STRINGS)
+    return pd.Series(
+        pd.arrays.BooleanArray(truthy, ~known), index=s.index, name=s.name
+    )
 
 
 def _parse_amount(col: pd.Series) -> pd.Series:
-    # Remove $ signs/spaces, handle parentheses for negatives.
-    cleaned = col.astype(str).str.replace(r"[$,\s]", "", regex=True)
-    cleaned = cleaned.str.replace(r"^\(([-\d.]+)\)$", r"-\1", regex=True)
-    return pd.to_numeric(cleaned, errors="coerce")
+    # Fast path: many exports already hold plain numbers, which need no cleaning.
+    try:
+        return pd.to_numeric(col, errors="raise").astype(np.float64)
+    except (ValueError, TypeError):
+        pass
+
+    # Remove $ signs/commas/whitespace, handle parentheses for negatives.
+    # \p{Z} catches non-breaking spaces, which Arrow's \s does not.
+    cleaned = col.astype("string[pyarrow]").str.replace(
+        r"[$,\s\p{Z}]", "", regex=True
+    )
+    negative = cleaned.str.startswith("(") & cleaned.str.endswith(")")
+    negative = negative.fillna(False).to_numpy(dtype=bool)
+    cleaned = cleaned.mask(negative, cleaned.str.slice(1, -1))
+
+    values = pd.to_numeric(
+        cleaned.to_numpy(dtype=object, na_value=np.nan),
+        errors="coerce",
+    ).astype(np.float64)
+    return pd.Series(
+        np.where(negative, -values, values), index=col.index, name=col.name
+    )
+
+
+# Low-cardinality label columns; stored as int codes rather than Python strings.
+_CATEGORICAL_COLS = ("Account", "Institution", "Category", "MyCategory")
+
+# Columns `convert_types` gives a fixed dtype, whatever the reader inferred.
+_TYPED_COLS = (
+    "Date",
+    "Is Hidden",
+    "Is Pending",
+    "Amount",
+    "Description",
+    *_CATEGORICAL_COLS,
+)
+
+
+def _categorize_labels(df: pd.DataFrame) -> None:
+    """Convert the `_CATEGORICAL_COLS` present in *df* to category, in place."""
+    for col in _CATEGORICAL_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype("string[pyarrow]").astype("category")
 
 
 def convert_types(df: pd.DataFrame) -> pd.DataFrame:
-    """Standardise column dtypes (Date ➜ datetime, Amount ➜ float, flags ➜ bool)."""
+    """Standardise column dtypes (Date ➜ datetime, Amount ➜ float, flags ➜ bool,
+    Description ➜ Arrow string, labels ➜ category).
+
+    Columns are replaced in place on *df* (which is also returned), so only the
+    converted columns are reallocated rather than the whole frame.
+    """
     if df.empty:
         return df
 
-    print("\n=== CONVERTING TYPES ===\n")
+    logger.debug("=== CONVERTING TYPES ===")
 
-    df = df.copy()
     if "Date" in df.columns:
         df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        print("✅ Converted date string to_datetime")
+        logger.debug("✅ Converted date string to_datetime")
 
     for col in ("Is Hidden", "Is Pending"):
         if col in df.columns:
-            df[col] = _to_bool(df[col].astype(str))
-            print("✅ Converted boolean strings to boolean")
+            df[col] = _to_bool(df[col])
+            logger.debug("✅ Converted boolean strings to boolean")
 
     if "Amount" in df.columns:
         df["Amount"] = _parse_amount(df["Amount"])
-        print("✅ Converted amount strings to numeric")
+        logger.debug("✅ Converted amount strings to numeric")
+
+    # Free text stays one value per row, but in a contiguous Arrow buffer:
+    # RuleEngine.description_has then runs str.contains in Arrow's kernels
+    # without first converting the column.
+    if "Description" in df.columns:
+        df["Description"] = df["Description"].astype("string[pyarrow]")
+        logger.debug("✅ Converted description to Arrow-backed strings")
+
+    _categorize_labels(df)
+    logger.debug("✅ Converted low-cardinality label columns to category")
+
+    # Dtypes are settled now; remember which columns are numeric so the
+    # de-duplication helpers don't have to re-scan every column's dtype.
+    df.attrs["numeric_cols"] = tuple(df.select_dtypes("number").columns)
 
     return df
 
@@ -182,35 +272,57 @@ def convert_types(df: pd.DataFrame) -> pd.DataFrame:
 ###############################################################################
 
 
-def coalesce_duplicates(df: pd.DataFrame, key: str) -> pd.DataFrame:
-    """Group on *key* and roll-up numeric columns with sum, others with first."""
-    if key not in df.columns:
-        raise KeyError(f"Column {key!r} not in DataFrame")
+def _numeric_columns(df: pd.DataFrame) -> Tuple[str, ...]:
+    """Numeric columns as recorded by `convert_types`, recomputed if missing."""
+    cols = df.attrs.get("numeric_cols")
+    if cols is None:
+        cols = df.select_dtypes("number").columns
+    return tuple(c for c in cols if c in df.columns)
 
-    print(f"\n=== COALESCING DUPLICATES on key='{key}' ===\n")
 
-    grouped = df.groupby(key, dropna=False)
+def coalesce_duplicates(
+    df: pd.DataFrame, key: str, sum_cols: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """Group on *key* and roll-up *sum_cols* with sum, others with first.
 
-    # For transparency, show which rows are being merged.
-    show_rows = 3
-    for group_key, group_df in grouped:
-        if len(group_df) > 1 and show_rows > 0:
-            show_rows -= 1
-            print(
-                f"  Merging {len(group_df)} rows for group {group_key!r}. "
-                f"RowIDs: {group_df.index.tolist()}"
-            )
+    *sum_cols* defaults to the numeric columns of *df*.
+    """
+    if key not in df.columns:
+        raise KeyError(f"Column {key!r} not in DataFrame")
 
-    if show_rows == 0:
-        print("  ... (remaining rows hidden)")
+    logger.debug("=== COALESCING DUPLICATES on key=%r ===", key)
+
+    # Group order is irrelevant here, so skip sorting the keys; observed=True
+    # avoids materialising unused categories if *key* is categorical.
+    grouped = df.groupby(key, dropna=False, sort=False, observed=True)
+
+    # For transparency, show which rows are being merged. Group sizes are
+    # computed in C; only the few groups we show are materialised.
+    if logger.isEnabledFor(logging.DEBUG):
+        show_rows = 3
+        sizes = grouped.size()
+        merged = sizes[sizes > 1]
+        for group_key, size in merged.head(show_rows).items():
+            logger.debug(
+                "  Merging %d rows for group %r. RowIDs: %s",
+                size,
+                group_key,
+                grouped.get_group(group_key).index.tolist(),
+            )
+        if len(merged) > show_rows:
+            logger.debug("  ... (remaining rows hidden)")
 
-    numeric_cols = df.select_dtypes("number").columns.difference([key])
-    other_cols = df.columns.difference(numeric_cols.union([key]))
+    if sum_cols is None:
+        sum_cols = _numeric_columns(df)
+    numeric_cols = [
+        c for c in sum_cols if c in df.columns and c != key and c not in _KEY_COLS
+    ]
+    other_cols = [c for c in df.columns if c != key and c not in numeric_cols]
 
     agg_spec = {**{c: "sum" for c in numeric_cols}, **{c: "first" for c in other_cols}}
     grouped = grouped.agg(agg_spec).reset_index()
 
-    print(f"\n✅ Total rows after de-duplication: {len(grouped)}")
+    logger.debug("✅ Total rows after de-duplication: %d", len(grouped))
 
     return grouped
 
@@ -220,27 +332,29 @@ def remove_duplicates(df: pd.DataFrame, key: str) -> pd.DataFrame:
     if key not in df.columns:
         raise KeyError(f"Column {key!r} not in DataFrame")
 
-    print(f"\n=== REMOVING DUPLICATES on key='{key}' ===\n")
+    logger.debug("=== REMOVING DUPLICATES on key=%r ===", key)
 
     # Track duplicates before removal
-    dup_mask = df.duplicated(subset=key, keep="first")
-    dup_count = dup_mask.sum()
-
-    if dup_count > 0:
-        print(f"  Removing {dup_count} duplicate rows:")
-        for row_id in df[dup_mask].index.tolist()[:5]:
-            row = df.loc[row_id]
-            details = [f"RowID: {row_id}"]
-            if "Date" in df.columns:
-                details.append(f"Date: {row['Date']}")
-            if "Description" in df.columns:
-                details.append(f"Desc: {row['Description']}")
-            if "Amount" in df.columns:
-                details.append(f"Amt: {row['Amount']}")
-            print("  " + " | ".join(details))
-
-        if dup_count > 3:
-            print(f"  ... and {dup_count-3} more duplicates")
+    if logger.isEnabledFor(logging.DEBUG):
+        show_rows = 5
+        dup_mask = df.duplicated(subset=key, keep="first")
+        dup_count = dup_mask.sum()
+
+        if dup_count > 0:
+            logger.debug("  Removing %d duplicate rows:", dup_count)
+            for row_id in df[dup_mask].index.tolist()[:show_rows]:
+                row = df.loc[row_id]
+                details = [f"RowID: {row_id}"]
+                if "Date" in df.columns:
+                    details.append(f"Date: {row['Date']}")
+                if "Description" in df.columns:
+                    details.append(f"Desc: {row['Description']}")
+                if "Amount" in df.columns:
+                    details.append(f"Amt: {row['Amount']}")
+                logger.debug("  " + " | ".join(details))
+
+            if dup_count > show_rows:
+                logger.debug("  ... and %d more duplicates", dup_count - show_rows)
 
     return df.drop_duplicates(subset=key, keep="first")
 
@@ -250,21 +364,80 @@ def remove_duplicates(df: pd.DataFrame, key: str) -> pd.DataFrame:
 ###############################################################################
 
 
+# Money columns summed when within-file duplicates are coalesced. Fixed up front
+# rather than inferred per file: a text column that is empty throughout one file
+# is read as float there, and must not be summed or zero-filled.
+_SUMMED_COLS = ("Amount",)
+
+
+def _all_columns(files: List[str]) -> List[str]:
+    """Union of the files' header columns in first-seen order, plus SourceFile."""
+    columns: dict = {}
+    for f in files:
+        try:
+            columns.update(dict.fromkeys(pd.read_csv(f, nrows=0).columns))
+        except Exception:  # pragma: no cover – `_read_one` warns about it.
+            continue
+    columns["SourceFile"] = None
+    return list(columns)
+
+
+def _clean_file(f: str, columns: List[str]) -> Optional[pd.DataFrame]:
+    """Load → type-convert → hash → coalesce within-file duplicates of one CSV.
+
+    The frame is first reindexed to *columns*, so that every file is hashed with
+    the same columns in the same order.
+    """
+    df = _read_one(f)
+    if df is None or df.empty:
+        return None
+    df = add_row_hashes(convert_types(df.reindex(columns=columns)))
+
+    # Only rows repeated within this file (same CrossKey) need to be grouped;
+    # everything else passes through untouched.
+    dup_mask = df.duplicated(subset="CrossKey", keep=False).to_numpy()
+    summed = [c for c in _SUMMED_COLS if c in df.columns]
+    dupes = coalesce_duplicates(df[dup_mask], key="CrossKey", sum_cols=summed)
+
+    # A group sum counts missing amounts as 0; do the same for the rows that
+    # skipped grouping so both paths agree.
+    uniques = df[~dup_mask].reset_index(drop=True)
+    uniques[summed] = uniques[summed].fillna(0)
+    return pd.concat([uniques, dupes], ignore_index=True)
+
+
 def clean_transactions(pattern: str = "../data/transactions_*.csv") -> pd.DataFrame:
-    """Load → type-convert → hash → de-duplicate within files."""
-    df = read_transactions(pattern)
-    if df.empty:
-        return df
-    df = convert_types(df)
-    df = add_row_hashes(df)
+    """Load → type-convert → hash → de-duplicate within files.
+
+    Each file is converted and coalesced on its own before the reduced frames are
+    combined, so peak memory tracks the largest few files rather than the sum of
+    all of them.
+    """
+    files = _match_files(pattern)
+    if not files:
+        return pd.DataFrame()
+
+    # Row keys are hashed file by file, so they only agree across files if
+    # every file has the same columns in the same order.
+    clean_file = partial(_clean_file, columns=_all_columns(files))
 
-    # Coalesce *within* file duplicates (CrossKey)
-    df = coalesce_duplicates(df, key="CrossKey")
+    # Coalesce *within* file duplicates (CrossKey), a few files at a time
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        partials = [df for df in executor.map(clean_file, files) if df is not None]
+    if not partials:
+        return pd.DataFrame()
 
-    # Remove *across* file duplicates (IntraKey)
-    df = remove_duplicates(df, key="IntraKey")
+    df = pd.concat(partials, ignore_index=True)
+    # Each file built its own categories; concatenating mismatched ones falls
+    # back to plain strings, so re-categorize over the combined frame.
+    _categorize_labels(df)
 
-    return df
+    # Remove *across* file duplicates (IntraKey); only the duplicated subset,
+    # usually a small minority, needs to be looked at.
+    dup_mask = df.duplicated(subset="IntraKey", keep=False).to_numpy()
+    dupes = remove_duplicates(df[dup_mask], key="IntraKey")
+
+    return pd.concat([df[~dup_mask], dupes], ignore_index=True)
 
 
 ###############################################################################
@@ -283,6 +456,8 @@ if __name__ == "__main__":  # pragma: no cover – quick preview only
     )
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     cleaned = clean_transactions(args.pattern)
     print(f"\n\n✅ Cleaned DataFrame shape: {cleaned.shape}\n")
     print(cleaned.head())
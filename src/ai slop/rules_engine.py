@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Iterable, List, Optional, Union
 from enum import Enum
 
 
@@ -39,7 +40,7 @@ class Rule:
     def __init__(
         self,
         description: str,
-        condition: Callable[[Dict[str, Any]], bool],
+        condition: Callable[[pd.DataFrame], pd.Series],
         category: Category,
     ):
         """
@@ -47,16 +48,62 @@ class Rule:
 
         Args:
             description: Human-readable description of the rule
-            condition: Function that takes a transaction dict and returns a boolean
+            condition: Function that takes a transactions DataFrame and returns a
+                boolean mask (one entry per row) of the transactions that match
             category: The Category enum value to assign if condition is True
         """
         self.description = description
         self.condition = condition
         self.category = category
+        self._category_equals: Optional[str] = None
 
-    def apply_condition(self, item: Dict[str, Any]) -> bool:
+    @classmethod
+    def category_is(
+        cls, description: str, candidate: str, category: Category
+    ) -> "Rule":
+        """
+        Create a rule matching transactions whose Category equals candidate.
+
+        The condition is derived from candidate, so RuleEngine can safely fuse
+        runs of these rules into a single lookup.
+        """
+        rule = cls(
+            description=description,
+            condition=lambda df: df["Category"] == candidate,
+            category=category,
+        )
+        rule._category_equals = candidate
+        return rule
+
+    @property
+    def category_equals(self) -> Optional[str]:
+        """The Category value this rule matches, if built with category_is."""
+        return self._category_equals
+
+    def apply_condition(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Apply the rule's condition to every row of a DataFrame at once.
+
+        Args:
+            df: DataFrame containing transaction data
+
+        Returns:
+            np.ndarray: Boolean mask, True where the condition is met
+        """
+        try:
+            mask = self.condition(df)
+        except (KeyError, TypeError, AttributeError) as e:
+            # Log or handle the error if needed
+            return np.zeros(len(df), dtype=bool)
+        if isinstance(mask, pd.Series):
+            # Nullable dtypes give <NA> where a value is missing; that's no match
+            mask = mask.to_numpy(dtype=bool, na_value=False)
+        # Conditions may return a scalar (e.g. an always-true fallback)
+        return np.broadcast_to(np.asarray(mask, dtype=bool), (len(df),))
+
+    def matches(self, item: Dict[str, Any]) -> bool:
         """
-        Apply the rule's condition to an item.
+        Check the rule's condition against a single transaction item.
 
         Args:
             item: Dictionary containing transaction data
@@ -65,9 +112,9 @@ class Rule:
             bool: True if the condition is met, False otherwise
         """
         try:
-            return self.condition(item)
+            return bool(self.condition(item))
         except (KeyError, TypeError, AttributeError) as e:
-            # Log or handle the error if needed
+            # Missing values (<NA>) refuse bool() with a TypeError: no match
             return False
 
     def get_category(self, item: Dict[str, Any]) -> Category:
@@ -80,10 +127,25 @@ class Rule:
         Returns:
             Category: The category if the rule matches, None otherwise
         """
-        if self.apply_condition(item):
+        if self.matches(item):
             return self.category
         return None
 
+    def get_categories(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Get the category for every row of a DataFrame where the rule matches.
+
+        Args:
+            df: DataFrame containing transaction data
+
+        Returns:
+            np.ndarray: Object array holding the category where the rule matches
+                and None elsewhere
+        """
+        categories = np.full(len(df), None, dtype=object)
+        categories[self.apply_condition(df)] = self.category
+        return categories
+
 
 class RuleEngine:
     """
@@ -91,62 +153,68 @@ class RuleEngine:
     Rules are applied in order, and the first matching rule assigns a category.
     """
 
-    def is_category_equal(self, item, candidate):
-        return item["Category"] == candidate
+    # Rule conditions receive either a whole DataFrame (classify_dataframe) or a
+    # single item dict (classify_item), so these helpers accept both.
+
+    def is_category_equal(
+        self, df: Union[pd.DataFrame, Dict[str, Any]], candidate: str
+    ) -> Union[pd.Series, bool]:
+        return df["Category"] == candidate
 
     def description_has(
         self,
-        item: Dict[str, Any],
+        df: Union[pd.DataFrame, Dict[str, Any]],
         substr: str,
-    ) -> bool:
-        if not item or not isinstance(item, dict):
-            return False
-
-        description = item.get("Description")
-        if not description or not isinstance(description, str):
-            return False
+    ) -> Union[pd.Series, bool]:
+        if isinstance(df, dict):
+            description = df.get("Description")
+            if not substr or not isinstance(description, str):
+                return False
+            return substr.lower() in description.lower()
 
         if not substr:
-            return False
+            return pd.Series(False, index=df.index)
 
-        description = description.lower()
-        substr = substr.lower()
-        return substr in description
+        # Case-insensitive literal match, run in Arrow's string kernels
+        return (
+            df["Description"]
+            .astype("string[pyarrow]")
+            .str.contains(substr, case=False, regex=False)
+        )
 
     def __init__(self):
         self.rules = [
-            Rule(
+            Rule.category_is(
                 description="Keep groceries the same",
-                condition=lambda item: self.is_category_equal(item, "Groceries"),
+                candidate="Groceries",
                 category=Category.GROCERIES,
             ),
-            Rule(
+            Rule.category_is(
                 description="Keep dining the same",
-                condition=lambda item: self.is_category_equal(
-                    item, "Restaurants/Dining"
-                ),
+                candidate="Restaurants/Dining",
                 category=Category.RESTAURANTS,
             ),
-            Rule(
+            Rule.category_is(
                 description="Keep utilities the same",
-                condition=lambda item: self.is_category_equal(
-                    item, "Energy, Gas & Electric"
-                ),
+                candidate="Energy, Gas & Electric",
                 category=Category.ELECTRICITY,
             ),
-            Rule(
+            Rule.category_is(
                 description="Keep salary the same",
-                condition=lambda item: self.is_category_equal(item, "Paycheck/Salary"),
+                candidate="Paycheck/Salary",
                 category=Category.SALARY,
             ),
-            Rule(
+            Rule.category_is(
                 description="Keep rideshare the same",
-                condition=lambda item: self.is_category_equal(item, "Rideshare"),
+                candidate="Rideshare",
                 category=Category.RIDESHARE,
             ),
             Rule(
                 description="Ally HYSA",
-                condition=lambda item: self.is_category_equal(item, "Transfers") and self.description_has("ALLY BANK DES"),
+                condition=lambda df: (
+                    self.is_category_equal(df, "Transfers")
+                    & self.description_has(df, "ALLY BANK DES")
+                ),
                 category=Category.SAVINGS,
             ),
             Rule(
@@ -156,6 +224,41 @@ class RuleEngine:
             ),
         ]
 
+    def _fused_rules(self) -> List[Union[Rule, Dict[str, Category]]]:
+        """
+        self.rules with each run of consecutive Category-equality rules merged
+        into a single {Category value: category} lookup.
+
+        Within a run a row can match at most one value, so the lookup keeps the
+        rules' priority; a repeated value keeps its first rule's category.
+        """
+        steps: List[Union[Rule, Dict[str, Category]]] = []
+        for rule in self.rules:
+            if rule.category_equals is None:
+                steps.append(rule)
+                continue
+            if not steps or not isinstance(steps[-1], dict):
+                steps.append({})
+            steps[-1].setdefault(rule.category_equals, rule.category)
+        return steps
+
+    def _category_lookup(
+        self, df: pd.DataFrame, lookup: Dict[str, np.int8]
+    ) -> np.ndarray:
+        """
+        Look every row's Category up in lookup in one pass.
+
+        Returns:
+            np.ndarray: int8 code per row, or -1 where the Category is not a key
+        """
+        if "Category" not in df.columns:
+            return np.full(len(df), -1, dtype=np.int8)
+
+        codes = np.array([*lookup.values(), -1], dtype=np.int8)
+        # get_indexer returns -1 for values not in lookup, which picks the
+        # trailing -1 sentinel
+        return codes[pd.Index(list(lookup)).get_indexer(df["Category"])]
+
     def classify_item(self, item: Dict[str, Any]) -> Category:
         """
         Classify a single transaction item.
@@ -166,19 +269,47 @@ class RuleEngine:
         Returns:
             Category: The assigned category
         """
-        for rule in self.rules:
-            category = rule.get_category(item)
-            if category is not None:
-                return category
-
+        # Plain Python per item: building a one-row DataFrame for the vectorized
+        # path costs far more than the rules themselves
+        category = item.get("Category")
+        for step in self._fused_rules():
+            if isinstance(step, dict):
+                try:
+                    match = step.get(category)
+                except TypeError:  # unhashable Category value
+                    match = None
+                if match is not None:
+                    return match
+            elif step.matches(item):
+                return step.category
         return Category.UNCATEGORIZED
 
+    def classify_items(self, items: Iterable[Dict[str, Any]]) -> List[Category]:
+        """
+        Classify a batch of transaction items.
+
+        For batches this is much cheaper than calling classify_item per item:
+        the rules run once over the whole batch instead of once per item.
+
+        Args:
+            items: Dictionaries containing transaction data
+
+        Returns:
+            List[Category]: The assigned category for each item, in order
+        """
+        df = self.classify_dataframe(pd.DataFrame(list(items)))
+        return [Category(value) for value in df["Smarter Category"]]
+
     def classify_dataframe(
         self, df: pd.DataFrame, output_column: str = "Smarter Category"
     ) -> pd.DataFrame:
         """
         Classify all transactions in a DataFrame.
 
+        Each rule is evaluated once over whole columns, and np.select picks the
+        first matching rule for every row, so rule order still sets priority.
+        Consecutive Category-equality rules are fused into a single lookup.
+
         Args:
             df: Input DataFrame containing transaction data
             output_column: Name of the column to store the category
@@ -189,8 +320,44 @@ class RuleEngine:
         if not isinstance(df, pd.DataFrame):
             raise TypeError("Input must be a pandas DataFrame.")
 
-        df[output_column] = df.apply(
-            lambda row: self.classify_item(row.to_dict()).value, axis=1
+        # Rules map to int8 codes into the Category enum; the column stores
+        # those codes and only renders the labels on demand, instead of holding
+        # a Python string per row.
+        categories = list(Category)
+        conditions, choices = [], []
+        default = np.int8(categories.index(Category.UNCATEGORIZED))
+
+        for step in self._fused_rules():
+            if isinstance(step, dict):
+                # A run of Category-equality rules: one lookup yields each
+                # row's code, or -1 where none of them matches
+                lookup = {
+                    value: np.int8(categories.index(category))
+                    for value, category in step.items()
+                }
+                run_codes = self._category_lookup(df, lookup)
+                conditions.append(run_codes >= 0)
+                choices.append(run_codes)
+                continue
+
+            rule = step
+            mask = rule.apply_condition(df)
+            code = np.int8(categories.index(rule.category))
+            if mask.all():
+                # Every row stops here (e.g. the fallback rule), so later
+                # rules can never win and this one needs no mask of its own
+                default = code
+                break
+            conditions.append(mask)
+            choices.append(code)
+
+        if conditions:
+            codes = np.select(conditions, choices, default=default)
+        else:
+            # np.select needs at least one condition
+            codes = np.full(len(df), default, dtype=np.int8)
+        df[output_column] = pd.Categorical.from_codes(
+            codes, categories=Category.get_all_categories()
         )
         return df
 
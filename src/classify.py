@@ -1,14 +1,26 @@
 from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import date
+import logging
+import ahocorasick
+import pandas as pd
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class Transaction:
     """
     A dataclass to represent a single transaction with all its columns.
     This enforces a consistent structure for all transaction data.
+    Slots are declared by hand (dataclass(slots=True) needs Python 3.10) so
+    instances carry no per-object __dict__.
     """
-    TransactionFingerprint: str
+    __slots__ = (
+        "TransactionFingerprint", "Amount", "Account", "Date",
+        "Description", "Institution", "Category", "MyCategory",
+    )
+
+    TransactionFingerprint: int
     Amount: float
     Account: str
     Date: date
@@ -104,37 +116,91 @@ class SpendingClassifier:
             },
         }
 
-    def _collapse_categories(self, categories_dict, prefix=""):
+        # The category tree never changes after construction, so flatten it once
+        self.collapsed_categories = self._collapse_categories(self.categories)
+        self.category_dtype = pd.CategoricalDtype(
+            ["uncategorized", *self.collapsed_categories]
+        )
+
+        # Lowercase description keywords for each category, mostly the merchants
+        # noted above. They all go into one Aho-Corasick automaton so every
+        # description is scanned once, no matter how many keywords there are.
+        # Keywords only match as whole words (see _match_description).
+        self.keywords = {
+            "spending.needs.utilities": ["coned", "con ed"],
+            "spending.shoulds.grocery": ["trader joe's", "trader joes", "whole foods"],
+            "spending.shoulds.fitness": ["nyrr"],
+            "spending.shoulds.services": ["icloud", "spotify", "loseit"],
+            "spending.shoulds.commuting": ["mta", "amtrak"],
+            "transfers.stocks": ["fzrox"],
+            "transfers.long_term_cash": ["ally bank"],
+        }
+        self._keyword_automaton = ahocorasick.Automaton()
+        for category, words in self.keywords.items():
+            for word in words:
+                self._keyword_automaton.add_word(word, (category, len(word)))
+        self._keyword_automaton.make_automaton()
+
+    def _collapse_categories(self, categories_dict):
         collapsed_list = []
 
-        for key, value in categories_dict.items():
-            # Create the path for the current key
-            if prefix:
-                current_path = f"{prefix}.{key}"
-            else:
-                current_path = key
+        # Walk the tree with an explicit stack instead of recursing. Paths are kept
+        # as tuples and only joined into a string once we reach a leaf.
+        # Children are pushed in reverse so they pop off in their original order.
+        stack = [((key,), value) for key, value in reversed(categories_dict.items())]
+        while stack:
+            path, value = stack.pop()
 
             # Check if the value is a dictionary
             if isinstance(value, dict) and value:
-                # If it's a non-empty dictionary, recurse
-                collapsed_list.extend(self._collapse_categories(value, current_path))
+                # If it's a non-empty dictionary, descend into it
+                stack.extend(
+                    (path + (key,), child) for key, child in reversed(value.items())
+                )
             else:
                 # If it's an empty dictionary (or not a dictionary), it's a final category
-                collapsed_list.append(current_path)
+                collapsed_list.append(".".join(path))
 
         return collapsed_list
 
-    def _parse_row_to_transaction(self, row):
-        return Transaction(
-            TransactionFingerprint=row.get("TransactionFingerprint"),
-            Amount=row.get("Amount"),
-            Account=row.get("Account"),
-            Date=row.get("Date"),
-            Description=row.get("Description"),
-            Institution=row.get("Institution"),
-            Category=row.get("Category"),
-            MyCategory="uncategorized")
+    def iter_transactions(self, df):
+        """
+        Lazily yield a Transaction per row, for code that wants per-row objects.
+        The classifier itself works on whole columns and never builds these.
+        """
+        columns = [f.name for f in fields(Transaction)]
+        rows = df.reindex(columns=columns)
+        if "MyCategory" not in df.columns:
+            rows["MyCategory"] = "uncategorized"
+        for values in rows.itertuples(index=False, name=None):
+            yield Transaction(*values)
+
+    def _match_description(self, description):
+        # The first keyword found as a whole word decides the category; a bare
+        # substring hit would let "mta" match inside "samta"
+        for end, (category, length) in self._keyword_automaton.iter(description):
+            start = end - length + 1
+            before = description[start - 1] if start > 0 else " "
+            after = description[end + 1] if end + 1 < len(description) else " "
+            if not before.isalnum() and not after.isalnum():
+                return category
+        return "uncategorized"
 
     def classify(self, df):
-        print(self._collapse_categories(self.categories))
-        df.apply(self._parse_row_to_transaction, axis=1)
+        logger.debug("Collapsed categories: %s", self.collapsed_categories)
+        if "Description" in df.columns:
+            # Lower-case the whole column at once in Arrow's string kernels
+            descriptions = (
+                df["Description"].astype("string[pyarrow]").str.lower().fillna("")
+            )
+        else:
+            descriptions = None
+
+        if descriptions is not None:
+            my_categories = [
+                self._match_description(d) for d in descriptions.to_numpy()
+            ]
+        else:
+            my_categories = ["uncategorized"] * len(df)
+        df["MyCategory"] = pd.Categorical(my_categories, dtype=self.category_dtype)
+        return df
@@ -1,8 +1,20 @@
 import glob
-import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# Columns read as raw strings; they are parsed explicitly after loading, so
+# there is no point letting the CSV reader infer types for them
+_CSV_DTYPES = {'Amount': str, 'Is Hidden': str, 'Is Pending': str}
+
+# Lower-cased flag values treated as True; anything else is False
+_TRUTHY_STRINGS = frozenset({'yes', 'y', 'true'})
+
 def read_transactions(
     pattern: str = "../data/transactions_*.csv",
     show_duplicates: bool = False
@@ -22,38 +34,79 @@ def read_transactions(
     pd.DataFrame
         Cleaned and de-duplicated transaction data
     """
-    def _row_hash(row: pd.Series, include_source: bool) -> str:
-        """Generate a stable 5-char SHA-256 hash for a row.
-
-        Args:
-            row: The row of data to hash
-            include_source: If True, includes the source filename in the hash.
-                          Use False to identify same transactions across files.
-                          Use True to identify unique rows including their source.
+    def _row_hashes(frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate stable 20-bit integer hashes for every row of a frame.
+
+        Returns:
+            A pair of uint32 hash arrays. The first excludes the source
+            filename, to identify the same transaction across files. The second
+            includes it, to identify unique rows including their source.
         """
-        vals = row.astype(str).values if include_source else row.drop('SourceFile', errors='ignore').astype(str).values
-        return hashlib.sha256(''.join(vals).encode()).hexdigest()[:5]
+        def _top_bits(h: np.ndarray) -> np.ndarray:
+            # Keep the top 20 bits; they depend on every bit of the input
+            return (h >> np.uint64(44)).astype(np.uint32)
+
+        # pandas hashes and combines the columns in vectorized numpy code, so
+        # no Python code runs per row. The source filename is combined with
+        # the transaction hash, so the other columns are only hashed once.
+        content = frame.drop(columns='SourceFile', errors='ignore')
+        h = pd.util.hash_pandas_object(content, index=False).to_numpy()
+        transaction_hashes = _top_bits(h)
+
+        if 'SourceFile' in frame.columns:
+            h = pd.util.hash_pandas_object(
+                pd.DataFrame({'hash': h, 'SourceFile': frame['SourceFile']}),
+                index=False,
+            ).to_numpy()
+        return transaction_hashes, _top_bits(h)
 
     def _parse_amount(series: pd.Series) -> pd.Series:
-        """Parse amount strings into numeric values."""
-        cleaned = series.astype(str).str.replace(r"[$,\s]", "", regex=True)
-        cleaned = cleaned.str.replace(r"^\(([-\d.]+)\)$", r"-\1", regex=True)
-        return pd.to_numeric(cleaned, errors="coerce")
+        """Parse amount strings into (float64) numeric values."""
+        # Fast path: columns of plain numbers need no cleaning at all
+        try:
+            return pd.to_numeric(series, errors="raise").astype(np.float64)
+        except (ValueError, TypeError):
+            pass
+
+        # Drop currency symbols, separators and all whitespace (including
+        # non-breaking spaces) in one Arrow regex pass; values in parentheses
+        # are negated numerically below.
+        cleaned = series.astype("string[pyarrow]").str.replace(
+            r"[$,\s\p{Z}]", "", regex=True
+        )
+        negative = cleaned.str.startswith("(") & cleaned.str.endswith(")")
+        negative = negative.fillna(False).to_numpy(dtype=bool)
+        cleaned = cleaned.mask(negative, cleaned.str.slice(1, -1))
+
+        values = pd.to_numeric(
+            cleaned.to_numpy(dtype=object, na_value=np.nan),
+            errors="coerce",
+        ).astype(np.float64)
+        return pd.Series(
+            np.where(negative, -values, values), index=series.index, name=series.name
+        )
 
     # 1. Read and combine files
     files = sorted(glob.glob(pattern))
     if not files:
-        print(f"No CSVs matched pattern {pattern!r}")
+        logger.warning("No CSVs matched pattern %r", pattern)
         return pd.DataFrame()
 
-    frames = []
-    for f in files:
+    def _read_one(f: str) -> Optional[pd.DataFrame]:
+        """Read a single CSV, returning None if it can't be parsed."""
         try:
-            df = pd.read_csv(f)
+            # The pyarrow engine parses with multiple threads
+            df = pd.read_csv(f, engine='pyarrow', dtype=_CSV_DTYPES)
             df['SourceFile'] = Path(f).name
-            frames.append(df)
+            return df
         except Exception as e:
-            print(f"[WARN] Skipping {f}: {e}")
+            logger.warning("Skipping %s: %s", f, e)
+            return None
+
+    # Parsing releases the GIL, so independent files can be read concurrently.
+    # map() keeps results in the same (sorted) order as files.
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        frames = [df for df in executor.map(_read_one, files) if df is not None]
 
     if not frames:
         return pd.DataFrame()
@@ -66,52 +119,49 @@ def read_transactions(
 
     for col in ('Is Hidden', 'Is Pending'):
         if col in df.columns:
-            df[col] = df[col].astype(str).str.lower().map({
-                'yes': True, 'y': True, 'true': True,
-                'no': False, 'n': False, 'false': False
-            }).fillna(False)
+            lowered = df[col].astype('string[pyarrow]').str.lower()
+            df[col] = lowered.isin(_TRUTHY_STRINGS)
 
     if 'Amount' in df.columns:
         df['Amount'] = _parse_amount(df['Amount'])
 
     # 3. Add hashes for deduplication
-    # This identifies the same transaction across different files
-    df['TransactionFingerprint'] = df.apply(
-        lambda r: _row_hash(r, include_source=False),
-        axis=1
+    # TransactionFingerprint identifies the same transaction across different
+    # files; UniqueRowFingerprint identifies each row including its source file
+    df['TransactionFingerprint'], df['UniqueRowFingerprint'] = _row_hashes(df)
+
+    # Create a stable row ID for reference (fingerprint as 5 hex digits)
+    unique_hashes = df['UniqueRowFingerprint'].to_numpy()
+    counters = df.groupby('UniqueRowFingerprint', sort=False).cumcount().add(1)
+    df.index = pd.Index(
+        [f"{key:05x}_{n}"
+         for key, n in zip(unique_hashes.tolist(), counters.tolist())],
+        name='RowID'
     )
 
-    # This creates a unique identifier for each row including its source file
-    df['UniqueRowFingerprint'] = df.apply(
-        lambda r: _row_hash(r, include_source=True),
-        axis=1
-    )
-
-    # Create a stable row ID for reference
-    df['RowID'] = df.groupby('UniqueRowFingerprint').cumcount().add(1).astype(str)
-    df['RowID'] = df['UniqueRowFingerprint'] + '_' + df['RowID']
-    df.set_index('RowID', inplace=True)
-
     # 4. Deduplication
     # First pass: merge duplicates within each file (same UniqueRowFingerprint)
-    def _merge_duplicates(group):
-        numeric_cols = group.select_dtypes('number').columns.difference([
-            'TransactionFingerprint',
-            'UniqueRowFingerprint'
-        ])
-        other_cols = group.columns.difference(
-            numeric_cols.union([
-                'UniqueRowFingerprint'  # Only exclude UniqueRowFingerprint from other_cols
-            ])
-        )
-        agg = {**{c: 'sum' for c in numeric_cols},
-              **{c: 'first' for c in other_cols}}
-        return group.groupby('UniqueRowFingerprint', dropna=False).agg(agg).reset_index()
-
-    df = _merge_duplicates(df)
+    # The integer fingerprints are keys, not amounts, so they are never summed
+    numeric_cols = df.select_dtypes('number').columns.drop(
+        ['TransactionFingerprint', 'UniqueRowFingerprint']
+    )
+    other_cols = df.columns.difference(
+        numeric_cols.union(['UniqueRowFingerprint'])  # Only exclude the group key
+    )
+    agg = {**{c: 'sum' for c in numeric_cols},
+           **{c: 'first' for c in other_cols}}
+    # sort=False: group order doesn't matter here, so skip sorting the keys
+    df = df.groupby(
+        'UniqueRowFingerprint', dropna=False, sort=False, as_index=False
+    ).agg(agg)
 
     # Second pass: remove duplicates across files (same TransactionFingerprint)
     # Use drop_duplicates instead of duplicated() for cleaner code
     df = df.drop_duplicates(subset=['TransactionFingerprint'], keep='first')
 
+    # 5. Store low-cardinality label columns as categoricals
+    for col in ('Account', 'Institution', 'Category', 'MyCategory'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
     return df
\ No newline at end of file
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "ai slop"))
+
+import finance_cleaner as fc  # noqa: E402
+
+SHARED = {
+    "Date": "2/26/2024",
+    "Description": "PAYCHECK ABC",
+    "Account": "Checking",
+    "Category": "Paycheck/Salary",
+    "Is Hidden": "No",
+    "Is Pending": "No",
+    "Amount": "1500.00",
+    "Tags": "",
+}
+
+
+def _write(path: Path, rows, columns) -> None:
+    pd.DataFrame(rows, columns=columns).to_csv(path, index=False)
+
+
+def test_same_row_in_files_with_different_column_order(tmp_path):
+    columns = list(SHARED)
+    _write(tmp_path / "transactions_a.csv", [SHARED], columns)
+    _write(tmp_path / "transactions_b.csv", [SHARED], columns[::-1])
+
+    cleaned = fc.clean_transactions(str(tmp_path / "transactions_*.csv"))
+
+    assert len(cleaned) == 1
+
+
+def test_same_row_in_files_with_different_tags_dtypes(tmp_path):
+    columns = list(SHARED)
+    other = {**SHARED, "Description": "TRADER JOES", "Tags": "food"}
+    # Tags is empty throughout file a, but holds text in file b
+    _write(tmp_path / "transactions_a.csv", [SHARED], columns)
+    _write(tmp_path / "transactions_b.csv", [SHARED, other], columns[::-1])
+
+    cleaned = fc.clean_transactions(str(tmp_path / "transactions_*.csv"))
+
+    assert len(cleaned) == 2
+    tags = cleaned.set_index("Description")["Tags"]
+    # Tags is text in the combined data, so it must not be summed or zero-filled
+    assert pd.isna(tags["PAYCHECK ABC"])
+    assert tags["TRADER JOES"] == "food"
+
+
+def test_within_file_duplicates_only_sum_amount(tmp_path):
+    columns = list(SHARED)
+    other = {**SHARED, "Description": "TRADER JOES", "Tags": "food"}
+    _write(tmp_path / "transactions_a.csv", [SHARED, SHARED], columns)
+    _write(tmp_path / "transactions_b.csv", [other], columns)
+
+    cleaned = fc.clean_transactions(str(tmp_path / "transactions_*.csv"))
+
+    paycheck = cleaned.set_index("Description").loc["PAYCHECK ABC"]
+    assert paycheck["Amount"] == 3000.0
+    assert pd.isna(paycheck["Tags"])